@@ -26,13 +26,53 @@ The API exposes a single endpoint `/search` that accepts a GET request with
 query string `q` and optional `max_results`, `region`, `safesearch` and
 `timelimit` parameters.  It returns a JSON response containing the list of
 results or an error message if no results are found.
+
+Responses are cached in process so repeated queries are answered without
+contacting DuckDuckGo again.  Set the ``REDIS_URL`` environment variable to
+share the cache between workers through Redis.
+
+When the API runs behind a reverse proxy (as on Render or Railway), set
+``PROXY_COUNT=1`` so that rate limiting sees the real client address.
 """
 
-from flask import Flask, request, jsonify
+# ---------------------------------------------------------------------------
+# Cooperative I/O under gevent
+#
+# Nearly all of the time spent in /search is waiting on HTTP requests to
+# DuckDuckGo and Wikipedia.  When gevent is installed the standard library is
+# patched so those waits yield to other requests, letting one gunicorn worker
+# serve many searches at once.  Patching must happen before anything imports
+# socket or ssl, hence its position at the very top of the module.
+#
+# Patching only covers pure-Python I/O such as requests (Wikipedia).
+# duckduckgo_search sends its requests through primp, a Rust extension that
+# gevent cannot patch, so searches are run in real OS threads instead (see
+# _run_blocking).
+try:
+    import gevent  # type: ignore
+    from gevent import monkey  # type: ignore
+    monkey.patch_all()
+except ImportError:
+    gevent = None  # type: ignore
+
+from flask import Flask, Response, request
+from werkzeug.middleware.proxy_fix import ProxyFix
 from duckduckgo_search import DDGS
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+import ast
+import hashlib
+import json
+import operator
 import os
+import queue
 import re
-from typing import Optional, Tuple, List, Dict
+import threading
+import time
+from typing import Optional, Tuple, Dict, FrozenSet
 
 # ----------------------------------------------------------------------------
 # Static population estimates
@@ -52,6 +92,55 @@ STATIC_POPULATION_ESTIMATES: Dict[str, str] = {
     # You can add more animals and their estimated populations here.
 }
 
+# ----------------------------------------------------------------------------
+# Precompiled regular expressions
+#
+# These run on every request, so they are compiled once at import time
+# rather than looked up in the re module's cache on each call.
+
+# Words and numbers in a query, for spell‑checking.  Apostrophes inside words
+# (contractions) are kept; other punctuation separates tokens.
+_WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)?|\d+")
+# Characters ignored when matching query keywords against results.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+# Question queries whose topic can be looked up on Wikipedia, matched in one
+# pass: the topic is in "question" for "what is"/"who is"/"define"/"meaning
+# of" questions and in "defined" for "... definition" queries.
+_Q_PATTERN = re.compile(
+    r"^(?:(?:what is|who is|define|meaning of)\s+(?P<question>.+)"
+    r"|(?P<defined>.+)\s+definition$)"
+)
+# Leading phrases removed from "how many"/"population of" questions, in the
+# order they may appear (e.g. "how many number of ...").
+_QUESTION_LEAD_RE = re.compile(
+    r"^(?:how many\s*)?(?:population of\s*)?(?:number of\s*)?(?:count of\s*)?"
+)
+# Leading "population"/"population of|for|in" removed from population queries.
+_POP_LEAD_RE = re.compile(r"^population(?: of| for| in)?")
+# Queries made only of numbers, arithmetic operators and parentheses, which
+# are answered without searching.  ** is rejected when evaluating.
+_ARITHMETIC_RE = re.compile(r"^[-+*/().\d\s]+$")
+_ARITHMETIC_MAX_LENGTH = 100
+_ARITHMETIC_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+# Trailing words removed from "how many ..." questions.
+_EXIST_RE = re.compile(r"( exist| are there| are)")
+# Common misspellings of "population".
+_MISSPELL_RE = re.compile(r"poplutation|popluation|popultation|populaton")
+# Query prefixes that can match _Q_PATTERN or the "how many"/"population of"
+# questions handled by _question_topic.
+_QUESTION_PREFIXES = ("what is", "who is", "define", "meaning of", "how many", "population of")
+# "population" or a common misspelling of it, found in a single scan.
+_POP_TRIGGER_RE = re.compile("population|" + _MISSPELL_RE.pattern)
+# Numbers followed by million/billion, e.g. "600 million" or "1.2 billion".
+_POP_NUM_RE = re.compile(r"\b([\d,]+(?:\.\d+)?\s*(?:million|billion))", re.IGNORECASE)
+
 
 # Helper function to extract a population estimate from DuckDuckGo search snippets.
 # It scans the snippet text for patterns like "600 million" or "1.2 billion".
@@ -67,26 +156,56 @@ def _extract_population_from_snippets(subject: str, results: list) -> Optional[s
         A formatted string describing the estimated population, or None if no
         suitable estimate is found.
     """
-    # Regular expression to match numbers followed by million/billion.
-    number_pattern = re.compile(r"\b([\d,]+(?:\.\d+)?\s*(?:million|billion))", re.IGNORECASE)
+    # Find mentions of the subject and population numbers in a single pass
+    # over each snippet, matching case-insensitively without allocating
+    # lowercased copies.
+    pattern = re.compile(
+        f"(?P<subject>{re.escape(subject)})|(?P<number>{_POP_NUM_RE.pattern})",
+        re.IGNORECASE,
+    )
     # Iterate over results, considering both the body and the title for number patterns.
     for res in results:
-        snippet = (res.get("body", "") or "") + " " + (res.get("title", "") or "")
-        # Skip if the snippet does not mention the subject at all; this reduces
-        # false positives from unrelated pages.  Use lowercase comparison.
-        if subject.lower() not in snippet.lower():
-            continue
-        # Find all matches of population numbers.
-        matches = number_pattern.findall(snippet)
-        if matches:
-            # Choose the last match (often the largest number/range).
-            estimate = matches[-1].strip()
+        body = res.get("body", "") or ""
+        title = res.get("title", "") or ""
+        # Yield between snippets: under gevent this lets the worker serve
+        # other requests, and under threaded servers it releases the GIL.
+        time.sleep(0)
+        seen_subject = False
+        last = None
+        # Scan the body and then the title without concatenating them.
+        for m in chain(pattern.finditer(body), pattern.finditer(title)):
+            if m.lastgroup == "subject":
+                seen_subject = True
+            else:
+                # Keep the last match (often the largest number/range).  Only
+                # the match object is kept; the text is sliced out once below.
+                last = m
+        # Skip snippets that do not mention the subject at all; this reduces
+        # false positives from unrelated pages.
+        if seen_subject and last is not None:
+            estimate = last.group("number").strip()
             return f"The estimated {subject} population is around {estimate}."
     # If no match found, return None
     return None
 
 
-def _filter_results_by_keywords(query: str, results: list) -> list:
+# Domains unlikely to be relevant for general knowledge queries.  A tuple, so
+# str.endswith can test them all in a single call.
+_BLOCKED_DOMAINS = (
+    "stackoverflow.com",
+    "serverfault.com",
+    "superuser.com",
+    "stackexchange.com",
+    "github.com",
+)
+
+
+def _query_keywords(lower_query: str) -> FrozenSet[str]:
+    """Return the keywords of a lowercased query, with punctuation removed."""
+    return frozenset(_NON_ALNUM_RE.sub(" ", lower_query).split())
+
+
+def _filter_results_by_keywords(keywords: FrozenSet[str], results: list) -> list:
     """
     Filter out search results that clearly don't match the user query.
 
@@ -95,22 +214,13 @@ def _filter_results_by_keywords(query: str, results: list) -> list:
     from the query.  If filtering would remove every result, the original list
     is returned instead.
 
-    :param query: The user query as entered (after spell‑checking).
+    :param keywords: The query keywords, as returned by :func:`_query_keywords`
+        for the query after spell‑checking.
     :param results: A list of result dictionaries with ``title``, ``href`` and ``body`` keys.
     :return: A filtered list of results.
     """
-    import re as _re
-    # Domains unlikely to be relevant for general knowledge queries.
-    blocked_domains = {
-        "stackoverflow.com",
-        "serverfault.com",
-        "superuser.com",
-        "stackexchange.com",
-        "github.com",
-    }
-    # Normalize the query: lowercase and remove punctuation.
-    cleaned_query = _re.sub(r"[^a-z0-9\s]", " ", query.lower())
-    keywords = [k for k in cleaned_query.split() if k]
+    if not results:
+        return results
     filtered = []
     for res in results:
         href = res.get("href", "") or ""
@@ -120,25 +230,45 @@ def _filter_results_by_keywords(query: str, results: list) -> list:
         except Exception:
             domain = ""
         # Skip blocked domains
-        if any(domain.endswith(bd) for bd in blocked_domains):
+        if domain.endswith(_BLOCKED_DOMAINS):
             continue
         title = (res.get("title", "") or "").lower()
         snippet = (res.get("body", "") or "").lower()
         combined = title + " " + snippet
-        combined = _re.sub(r"[^a-z0-9\s]", " ", combined)
+        combined = _NON_ALNUM_RE.sub(" ", combined)
         if all(k in combined for k in keywords):
             filtered.append(res)
     # If no results remain, return the original list to avoid empty responses
     return filtered or results
 
+# ---------------------------------------------------------------------------
+# Wikipedia answers
+#
+# Short answers come straight from the MediaWiki API, which returns JSON:
+# a single request finds the best matching page and its first sentence, with
+# no HTML parsing involved.  Requests go through a shared session so that
+# connections (and their TLS handshakes) are reused across requests.
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+# Timeout in seconds for each upstream HTTP call (Wikipedia and DuckDuckGo),
+# and the overall budget a search request may spend waiting on the
+# DuckDuckGo search and the Wikipedia lookups.
+WIKI_TIMEOUT = float(os.environ.get("WIKI_TIMEOUT", 3))
+SEARCH_TIMEOUT = float(os.environ.get("SEARCH_TIMEOUT", 5))
+REQUEST_DEADLINE = float(os.environ.get("REQUEST_DEADLINE", 8))
 try:
-    # The wikipedia library provides convenient access to Wikipedia summaries.
-    import wikipedia  # type: ignore
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
 except ImportError:
-    # If wikipedia is not installed, the API will still function but no answers
-    # will be generated.  In production you should add 'wikipedia' to your
+    # If requests is not installed, the API will still function but no answers
+    # will be generated.  In production you should add 'requests' to your
     # requirements.txt to enable richer responses.
-    wikipedia = None  # type: ignore
+    requests = None  # type: ignore
+
+_http = None
+if requests is not None:
+    _http = requests.Session()
+    _http.headers["User-Agent"] = "GooBlox (https://github.com/RotationOstracize/GooBlox)"
+    _http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=128, max_retries=1))
 
 # ---------------------------------------------------------------------------
 # Optional spelling correction
@@ -155,12 +285,623 @@ except Exception:
     # Spell checking is optional; gracefully handle missing dependency.
     _spellchecker = None
 
+
+@lru_cache(maxsize=8192)
+def _spell_correction(word: str) -> str:
+    """Return the most likely correction for the lowercase ``word``.
+
+    Corrections are memoized since the same typos recur across requests.
+    Words without any candidate correction are returned unchanged.
+    """
+    return _spellchecker.correction(word) or word
+
+# ---------------------------------------------------------------------------
+# Optional fast JSON encoding
+#
+# Responses can carry dozens of search results.  orjson encodes them several
+# times faster than the standard library encoder behind Flask's jsonify, and
+# also decodes the Wikipedia API responses faster than json.loads; if it
+# isn't installed, the standard encoders are used instead.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _loads(data: bytes):
+    """Parse JSON ``data``, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+#
+# Identical searches are common (Roblox clients polling, bots retrying), and
+# every one of them costs a round-trip to DuckDuckGo and counts against its
+# rate limits.  The serialized JSON response is cached for SEARCH_CACHE_TTL
+# seconds and Wikipedia summaries for WIKI_CACHE_TTL seconds, in two tiers:
+# a small in-process TTL cache checked first, and Redis, shared by all
+# workers, when the redis library is installed and REDIS_URL is set.  With
+# Redis, a short-lived lock also makes concurrent requests for the same
+# uncached query wait for the first one instead of all hitting DuckDuckGo at
+# once.
+try:
+    import redis  # type: ignore
+except ImportError:
+    redis = None  # type: ignore
+
+# Seconds to wait for Redis to connect or answer before treating the call as
+# a cache miss.  Every uncached search makes several Redis calls, so a slow or
+# unreachable Redis must fail fast rather than stall each request.
+REDIS_TIMEOUT = float(os.environ.get("REDIS_TIMEOUT", 0.25))
+
+_redis = None
+if redis is not None and os.environ.get("REDIS_URL"):
+    _redis = redis.Redis.from_url(
+        os.environ["REDIS_URL"],
+        socket_connect_timeout=REDIS_TIMEOUT,
+        socket_timeout=REDIS_TIMEOUT,
+    )
+
+SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", 60))
+WIKI_CACHE_TTL = int(os.environ.get("WIKI_CACHE_TTL", 86400))
+# How long a request holds the lock for an uncached query, and how long other
+# requests for the same query wait for it before searching themselves.
+_CACHE_LOCK_TTL = 10
+_CACHE_WAIT_SECONDS = 2.0
+_CACHE_POLL_INTERVAL = 0.05
+
+# In-process tier: key -> (expiry time, value), least recently used first.
+LOCAL_CACHE_SIZE = int(os.environ.get("LOCAL_CACHE_SIZE", 4096))
+_local_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_local_cache_lock = threading.Lock()
+
+
+def _local_cache_get(key: str) -> Optional[bytes]:
+    """Return the unexpired in-process value for ``key``, or None."""
+    with _local_cache_lock:
+        entry = _local_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _local_cache[key]
+            return None
+        _local_cache.move_to_end(key)
+        return entry[1]
+
+
+def _local_cache_set(key: str, value: bytes, ttl: float) -> None:
+    """Store ``value`` in process for ``ttl`` seconds, evicting the LRU entry."""
+    with _local_cache_lock:
+        _local_cache[key] = (time.monotonic() + ttl, value)
+        _local_cache.move_to_end(key)
+        if len(_local_cache) > LOCAL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+
+def _cache_key(namespace: str, *parts) -> str:
+    """Build a compact Redis key from arbitrary JSON-serializable parts."""
+    digest = hashlib.blake2b(
+        json.dumps(parts, sort_keys=True).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return f"gb:{namespace}:{digest}"
+
+
+def _cache_get(key: str) -> Optional[bytes]:
+    """Return the cached value for ``key`` or None on a miss.
+
+    The in-process tier is checked first; Redis hits are copied into it for
+    the rest of their lifetime.  Redis errors are treated as misses so an
+    unavailable cache never breaks searching.
+    """
+    value = _local_cache_get(key)
+    if value is not None or _redis is None:
+        return value
+    try:
+        value, ttl = _redis.pipeline().get(key).ttl(key).execute()
+    except Exception:
+        return None
+    if value is not None and ttl > 0:
+        _local_cache_set(key, value, ttl)
+    return value
+
+
+def _cache_set(key: str, value, ttl: int) -> None:
+    """Store ``value`` under ``key`` for ``ttl`` seconds, ignoring Redis errors."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    _local_cache_set(key, value, ttl)
+    if _redis is None:
+        return
+    try:
+        _redis.set(key, value, ex=ttl)
+    except Exception:
+        pass
+
+
+def _cache_lock(key: str) -> bool:
+    """Try to become the single request that computes ``key``.
+
+    Returns True when the caller should compute the value, either because it
+    acquired the lock or because locking is unavailable.
+    """
+    if _redis is None:
+        return True
+    try:
+        return bool(_redis.set(key + ":lock", "1", nx=True, ex=_CACHE_LOCK_TTL))
+    except Exception:
+        return True
+
+
+def _cache_unlock(key: str) -> None:
+    """Release a lock taken with :func:`_cache_lock`."""
+    if _redis is None:
+        return
+    try:
+        _redis.delete(key + ":lock")
+    except Exception:
+        pass
+
+
+def _cache_wait(key: str) -> Optional[bytes]:
+    """Poll for ``key`` while another request computes it.
+
+    Returns the cached value, or None if it did not appear within
+    ``_CACHE_WAIT_SECONDS``.
+    """
+    deadline = time.monotonic() + _CACHE_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(_CACHE_POLL_INTERVAL)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+#
+# DuckDuckGo starts rejecting requests when it is queried too quickly, and by
+# then the round-trip has already been spent and the client gets a 500.  When
+# Redis is available, searches that would reach DuckDuckGo are counted in
+# fixed one-minute windows, per client and globally, and requests over either
+# limit are rejected with 429 up front.  Cached responses are not counted.
+RATE_LIMIT_PER_CLIENT = int(os.environ.get("RATE_LIMIT_PER_CLIENT", 30))
+RATE_LIMIT_GLOBAL = int(os.environ.get("RATE_LIMIT_GLOBAL", 300))
+_RATE_LIMIT_WINDOW = 60
+
+# Increment a counter, starting its expiry window on the first hit.
+_RATE_LIMIT_SCRIPT = """
+local c = redis.call('INCR', KEYS[1])
+if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+return c
+"""
+_rate_limit_incr = _redis.register_script(_RATE_LIMIT_SCRIPT) if _redis is not None else None
+
+
+def _rate_limited(client: str) -> bool:
+    """Count a search for ``client`` and return True if it is over a limit.
+
+    Always returns False when Redis is not configured or unavailable.
+    """
+    if _rate_limit_incr is None:
+        return False
+    window = [_RATE_LIMIT_WINDOW]
+    try:
+        if _rate_limit_incr(keys=[f"gb:rl:{client}"], args=window) > RATE_LIMIT_PER_CLIENT:
+            return True
+        return _rate_limit_incr(keys=["gb:rl:global"], args=window) > RATE_LIMIT_GLOBAL
+    except Exception:
+        return False
+
+
+def _wikipedia_extract(topic: str) -> str:
+    """Return the first sentence of the best Wikipedia search hit for ``topic``.
+
+    The search and the extract are fetched in one request by using the
+    search as a generator for the extracts query.  An empty string is
+    returned when nothing is found or the best hit is a disambiguation page.
+    Network and HTTP errors are raised to the caller.
+    """
+    resp = _http.get(
+        WIKIPEDIA_API_URL,
+        params={
+            "action": "query",
+            "format": "json",
+            "generator": "search",
+            "gsrsearch": topic,
+            "gsrlimit": 1,
+            "prop": "extracts|pageprops",
+            "ppprop": "disambiguation",
+            "explaintext": 1,
+            "exsentences": 1,
+            "redirects": 1,
+        },
+        timeout=WIKI_TIMEOUT,
+    )
+    resp.raise_for_status()
+    pages = _loads(resp.content).get("query", {}).get("pages", {})
+    for page in pages.values():
+        if "missing" in page or "disambiguation" in page.get("pageprops", {}):
+            return ""
+        return page.get("extract", "")
+    return ""
+
+
+def _wikipedia_summary(topic: str) -> Optional[str]:
+    """Return the first sentence of the best Wikipedia match for ``topic``.
+
+    The topic is normalized for case and whitespace so trivially different
+    queries share cache entries.  Returns None if no page is found or the
+    lookup fails.
+    """
+    try:
+        return _wikipedia_lookup(" ".join(topic.lower().split())) or None
+    except Exception:
+        return None
+
+
+def _wikipedia_lookup(topic: str) -> str:
+    """Look up the summary for a normalized ``topic``.
+
+    Results are cached for WIKI_CACHE_TTL seconds in the in-process tier and,
+    when available, in Redis.  Lookups
+    that find no page return (and cache) an empty string; errors propagate so
+    that failed lookups are not cached and are retried on the next request.
+    """
+    key = _cache_key("wiki", topic)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached.decode("utf-8")
+    # Search Wikipedia for the best page and fetch a concise summary (first
+    # sentence) of it.
+    summary = _wikipedia_extract(topic).strip()
+    _cache_set(key, summary, WIKI_CACHE_TTL)
+    return summary
+
+
+def _population_subject(lower_query: str) -> Optional[str]:
+    """Return the subject of a population query, if any.
+
+    Common misspellings of "population" are corrected first, so
+    "cat popluation" and "population of cats" yield "cat" and "cats".
+
+    :param lower_query: The lowercased, stripped query.
+    :return: The subject, or None if the query is not a population query.
+    """
+    lower_query_corrected = _MISSPELL_RE.sub("population", lower_query)
+    if "population" not in lower_query_corrected:
+        return None
+    # Extract the subject by removing leading population phrases.
+    # E.g., "cat population" -> "cat", "population of cats" -> "cats".
+    subject = _POP_LEAD_RE.sub("", lower_query_corrected, count=1).strip()
+    # Also remove a trailing " population" if present (e.g., "cat population").
+    if subject.endswith(" population"):
+        subject = subject[: -len(" population")].strip()
+    return subject or None
+
+
+def _eval_arithmetic(node: ast.AST) -> float:
+    """Evaluate a parsed arithmetic expression limited to + - * / and parentheses.
+
+    Raises ValueError for any other kind of expression.
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        return _ARITHMETIC_OPS[type(node.op)](_eval_arithmetic(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC_OPS:
+        return _ARITHMETIC_OPS[type(node.op)](
+            _eval_arithmetic(node.left), _eval_arithmetic(node.right)
+        )
+    raise ValueError("unsupported expression")
+
+
+def _is_intended_arithmetic(query: str, expression: ast.AST) -> bool:
+    """Return True if the parsed ``query`` is clearly meant as arithmetic.
+
+    Plain "-" and "/" also appear in dates, ranges and phone numbers
+    ("12/25", "1939 - 1945", "(2020-2021)", "+1-800-555-1234"), so the
+    expression must contain an addition or multiplication, or a subtraction
+    or division in parentheses inside a larger expression.  A unary "+"
+    only ever shows up in phone numbers and rejects the query outright.
+    """
+    intended = False
+    for node in ast.walk(expression):
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+            return False
+        if not isinstance(node, ast.BinOp):
+            continue
+        if isinstance(node.op, (ast.Add, ast.Mult)):
+            intended = True
+        elif node is not expression and (
+            query[: node.col_offset].rstrip().endswith("(")
+            and query[node.end_col_offset :].lstrip().startswith(")")
+        ):
+            intended = True
+    return intended
+
+
+def _fast_path_answer(query: str) -> Optional[str]:
+    """Answer queries that need no search at all, such as "12 * (3 + 4)".
+
+    Only plain arithmetic that :func:`_is_intended_arithmetic` accepts is
+    answered, so bare numbers like "1984", dates, ranges and phone numbers
+    are still searched.
+
+    :param query: The stripped query as entered by the user.
+    :return: The answer, or None if the query should be searched normally.
+    """
+    if len(query) > _ARITHMETIC_MAX_LENGTH or not _ARITHMETIC_RE.match(query):
+        return None
+    try:
+        expression = ast.parse(query, mode="eval").body
+        if not isinstance(expression, ast.BinOp):
+            return None
+        if not _is_intended_arithmetic(query, expression):
+            return None
+        result = _eval_arithmetic(expression)
+    except (SyntaxError, ValueError, ZeroDivisionError, OverflowError):
+        return None
+    if isinstance(result, float):
+        if result.is_integer():
+            return str(int(result))
+        return f"{result:.12g}"
+    return str(result)
+
+
+def _question_topic(lower_query: str) -> Optional[str]:
+    """Return the Wikipedia topic for a question‑style query, if any.
+
+    Handles "what is"/"who is"/"define"/"meaning of" questions and
+    "... definition" queries, plus "how many"/"population of" questions which
+    are turned into "<subject> population" topics.
+
+    :param lower_query: The lowercased, stripped query.
+    :return: The topic to look up, or None if the query is not a question.
+    """
+    # If the query asks "what is", "who is", "define", etc.,
+    # we attempt to fetch a short summary from Wikipedia.
+    m = _Q_PATTERN.match(lower_query)
+    if m:
+        return m.group("question") or m.group("defined")
+
+    # Handle questions starting with "how many" or "population of"
+    if lower_query.startswith("how many") or lower_query.startswith("population of"):
+        # Extract the subject for population queries
+        # e.g., "how many cats exist" -> "cats"
+        # Remove leading phrases
+        subject = _QUESTION_LEAD_RE.sub("", lower_query, count=1)
+        # Remove common trailing words
+        subject = _EXIST_RE.sub("", subject).strip()
+        return subject + " population"
+    return None
+
+
 app = Flask(__name__)
 
+# Hosting platforms such as Render and Railway sit behind a reverse proxy that
+# appends the client address to X-Forwarded-For; set PROXY_COUNT=1 there (or
+# to the number of proxies in front of the app).  Only the last PROXY_COUNT
+# entries are added by trusted proxies; anything before them comes from the
+# client and could be forged, e.g. to dodge the per-client rate limit.  The
+# default of 0 ignores X-Forwarded-For, which is right when clients connect
+# directly, e.g. on a self-hosted VPS.
+PROXY_COUNT = int(os.environ.get("PROXY_COUNT", 0))
+if PROXY_COUNT > 0:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=PROXY_COUNT)
+
+# Compress responses with gzip/brotli when Flask-Compress is installed.  JSON
+# search results shrink several times over, which matters for mobile clients.
+try:
+    from flask_compress import Compress  # type: ignore
+    Compress(app)
+except ImportError:
+    pass
+
 # Initialize the search engine once at startup.  You can configure a proxy
 # via the environment variable DDGS_PROXY if you wish to use Tor or other
 # proxies; see the library documentation【7990937418174†L282-L304】.
-search_engine = DDGS()
+search_engine = DDGS(timeout=SEARCH_TIMEOUT)
+
+# A DDGS client is not safe to use from several requests at once, so each
+# search borrows one from this pool and returns it afterwards, keeping its
+# connections alive for the next request.  Clients are created on demand when
+# the pool is empty; at most DDGS_POOL_SIZE idle clients are kept.
+DDGS_POOL_SIZE = int(os.environ.get("DDGS_POOL_SIZE", 32))
+_ddgs_pool: "queue.Queue[DDGS]" = queue.Queue(maxsize=DDGS_POOL_SIZE)
+_ddgs_pool.put(search_engine)
+
+
+@contextmanager
+def _borrow_search_engine():
+    """Borrow a DDGS client from the pool for the duration of a ``with`` block.
+
+    A client whose search timed out is not returned to the pool, since the
+    search may still be using it in another thread.
+    """
+    try:
+        engine = _ddgs_pool.get_nowait()
+    except queue.Empty:
+        engine = DDGS(timeout=SEARCH_TIMEOUT)
+    reusable = True
+    try:
+        yield engine
+    except FutureTimeout:
+        reusable = False
+        raise
+    finally:
+        if reusable:
+            try:
+                _ddgs_pool.put_nowait(engine)
+            except queue.Full:
+                pass
+
+# Without gevent, searches with a timeout run on these threads so that the
+# request thread can stop waiting for them.  (Under gevent, threads from
+# this module are greenlets; the hub's thread pool is used instead.)
+_search_executor = ThreadPoolExecutor(max_workers=DDGS_POOL_SIZE) if gevent is None else None
+
+
+def _run_blocking(fn, *args, timeout: Optional[float] = None, **kwargs):
+    """Call ``fn`` without blocking other requests, and return its result.
+
+    Under gevent, ``fn`` runs in the hub's pool of real OS threads (at most
+    DDGS_POOL_SIZE at once) while the calling greenlet waits; use it for
+    I/O that gevent cannot patch, such as DDGS searches.  Otherwise ``fn``
+    is called in the current thread, or in :data:`_search_executor` when a
+    ``timeout`` is given.
+
+    :raises concurrent.futures.TimeoutError: If ``fn`` does not finish
+        within ``timeout`` seconds.  If it has not started yet it is
+        cancelled; a call already in progress keeps running in the
+        background.
+    """
+    if gevent is None:
+        if timeout is None:
+            return fn(*args, **kwargs)
+        future = _search_executor.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise
+    threadpool = gevent.get_hub().threadpool
+    if threadpool.maxsize < DDGS_POOL_SIZE:
+        threadpool.maxsize = DDGS_POOL_SIZE
+    # gevent's thread pool cannot cancel queued calls, so a call checks this
+    # flag when it starts instead.
+    abandoned = []
+
+    def _call():
+        if abandoned:
+            return None
+        return fn(*args, **kwargs)
+
+    try:
+        return threadpool.spawn(_call).get(timeout=timeout)
+    except gevent.Timeout:
+        abandoned.append(True)
+        raise FutureTimeout() from None
+
+
+def _text_results(engine: DDGS, **kwargs) -> list:
+    """Run a DDGS text search and return all of its results as a list."""
+    return list(engine.text(**kwargs) or ())
+
+# Thread pool for network lookups that can overlap with the DuckDuckGo
+# search.  Under gevent the threads are patched into greenlets.
+LOOKUP_WORKERS = int(os.environ.get("LOOKUP_WORKERS", 8))
+_executor = ThreadPoolExecutor(max_workers=LOOKUP_WORKERS)
+# Lookups submitted to _executor that have not finished yet.
+_lookups_in_flight = 0
+_lookups_lock = threading.Lock()
+
+
+def _lookup_done(future) -> None:
+    """Done callback counting a finished :func:`_submit_lookup` lookup."""
+    global _lookups_in_flight
+    with _lookups_lock:
+        _lookups_in_flight -= 1
+
+
+def _submit_lookup(fn, *args, speculative: bool = False):
+    """Submit a lookup to :data:`_executor` and return its future.
+
+    Speculative lookups, whose result may not be needed, are only started
+    while a worker is idle, so under load they never queue up ahead of
+    lookups that are needed; None is returned instead.
+    """
+    global _lookups_in_flight
+    with _lookups_lock:
+        if speculative and _lookups_in_flight >= LOOKUP_WORKERS:
+            return None
+        _lookups_in_flight += 1
+    future = _executor.submit(fn, *args)
+    future.add_done_callback(_lookup_done)
+    return future
+
+# Accepted values for the safesearch parameter.
+_SAFESEARCH_VALUES = frozenset(("on", "moderate", "off"))
+# Default regions: US English for ASCII queries, worldwide for the rest.
+_REGION_EN = "us-en"
+_REGION_WORLDWIDE = "wt-wt"
+# Keys of a DDGS text result that may be requested with the fields parameter.
+_RESULT_FIELDS = frozenset(("title", "href", "body"))
+
+
+def _dumps(obj) -> bytes:
+    """Serialize ``obj`` to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return app.json.dumps(obj).encode("utf-8")
+
+
+def _json_response(payload, status: int = 200) -> Response:
+    """Return a JSON response.
+
+    ``payload`` is either an object to serialize or JSON bytes that were
+    serialized earlier (e.g. read back from the cache).
+    """
+    if not isinstance(payload, bytes):
+        payload = _dumps(payload)
+    return app.response_class(payload, status=status, mimetype="application/json")
+
+
+def _search_response(payload: bytes) -> Response:
+    """Return a successful search response that clients and CDNs may cache.
+
+    The response carries an ETag derived from its body and a Cache-Control
+    header matching the server-side cache TTL.  Requests whose If-None-Match
+    header matches the ETag receive an empty 304 Not Modified instead.
+    """
+    resp = _json_response(payload)
+    resp.set_etag(hashlib.blake2b(payload, digest_size=8).hexdigest())
+    resp.headers["Cache-Control"] = (
+        f"public, max-age={SEARCH_CACHE_TTL}, stale-while-revalidate=300"
+    )
+    return resp.make_conditional(request)
+
+
+def _correct_spelling(query: str) -> str:
+    """Return ``query`` with obvious spelling mistakes corrected.
+
+    Only call this for ASCII queries, to avoid corrupting queries in
+    non‑Latin scripts.  The query is returned unchanged when pyspellchecker
+    is not installed or no word needs correcting.
+    """
+    if _spellchecker is None:
+        return query
+    # Use a simple regex to extract words and numbers; this avoids splitting
+    # on punctuation such as hyphens or apostrophes in contractions.
+    # Classify all words in one call; only words missing from the
+    # dictionary need the (slow) correction search.
+    unknown = _spellchecker.unknown(
+        [w for w in _WORD_RE.findall(query.lower()) if w.isalpha()]
+    )
+    if not unknown:
+        return query
+
+    def _correct(m: "re.Match[str]") -> str:
+        token = m.group(0)
+        # Only spell‑check alphabetic tokens; leave numbers unchanged.
+        if not token.isalpha():
+            return token
+        lowered = token.lower()
+        if lowered not in unknown:
+            return token
+        corrected = _spell_correction(lowered)
+        if corrected == lowered:
+            return token
+        # Preserve initial capitalisation.
+        return corrected.title() if token[0].isupper() else corrected
+
+    # Replace words in place so spacing and punctuation are preserved; the
+    # query only differs from the original if a word was corrected.
+    return _WORD_RE.sub(_correct, query)
+
 
 @app.route("/search", methods=["GET"])
 def search():
@@ -172,14 +913,23 @@ def search():
     - region:   Search region code, e.g., "us-en" for United States (optional).
     - safesearch: "on", "moderate", or "off" (optional, defaults to "moderate").
     - timelimit: Time filter: d=day, w=week, m=month, y=year (optional).
+    - fields:   Comma‑separated result keys to return, any of "title", "href"
+                and "body" (optional, defaults to all three).  Leaving out
+                "body" makes the response much smaller.
 
     Returns JSON with keys:
     - query:     Echo of the input query.
-    - results:   List of result dictionaries with keys "title", "href", "body".
+    - results:   List of result dictionaries with keys "title", "href", "body"
+                 (or the subset requested with ``fields``).
     - count:     Number of results returned.
     - message:   Optional message when no results are found.
     - error:     Optional error description when an invalid request occurs.
 
+    Successful responses are cached in process and in Redis when REDIS_URL is
+    configured, and carry ETag and Cache-Control headers so that CDNs and HTTP
+    clients can cache them too; conditional requests are answered with 304
+    Not Modified.
+
     Example request:
     GET /search?q=python%20programming&max_results=3
 
@@ -198,83 +948,199 @@ def search():
     }
     """
     query = request.args.get("q")
-    if not query:
-        return jsonify({"error": "Missing query parameter 'q'"}), 400
+    if not query or not query.strip():
+        return _json_response({"error": "Missing query parameter 'q'"}, 400)
+
+    # Answer queries such as plain arithmetic directly, without searching.
+    fast_answer = _fast_path_answer(query.strip())
+    if fast_answer is not None:
+        return _search_response(
+            _dumps({"query": query, "count": 0, "results": [], "answer": fast_answer})
+        )
 
     # Preserve the original query for the response before any transformation.
     original_query = query
-    # Attempt to correct obvious spelling mistakes using pyspellchecker.
-    # Only apply to ASCII queries to avoid corrupting queries in non‑Latin scripts.
-    effective_query = query
-    spellchecked_used = False
-    if _spellchecker is not None and all(ord(ch) < 128 for ch in original_query):
-        # Use a simple regex to extract words and numbers; this avoids splitting
-        # on punctuation such as hyphens or apostrophes in contractions.
-        words = re.findall(r"[A-Za-z]+(?:'[A-Za-z]+)?|\d+", original_query)
-        corrected_tokens = []
-        for token in words:
-            # Only spell‑check alphabetic tokens; leave numbers unchanged.
-            if token.isalpha():
-                # Lowercase for correction; preserve initial capitalisation.
-                corrected = _spellchecker.correction(token.lower())
-                if token[0].isupper():
-                    corrected = corrected.title()
-                corrected_tokens.append(corrected)
-            else:
-                corrected_tokens.append(token)
-        corrected_query = " ".join(corrected_tokens)
-        # If the corrected query differs (case‑insensitive), use it.
-        if corrected_query.lower() != original_query.lower():
-            effective_query = corrected_query
-            spellchecked_used = True
-    # Use the possibly corrected query for all downstream processing
-    query = effective_query
+    # Whether the query is plain ASCII decides both spell‑checking and the
+    # default region; spell‑checking only substitutes ASCII words, so the
+    # answer holds for the corrected query too.
+    ascii_query = original_query.isascii()
 
     # Parse optional parameters with sensible defaults
     # Start with the user‑supplied max_results or default to 5
-    try:
-        max_results = int(request.args.get("max_results", 5))
-        if max_results <= 0:
-            raise ValueError
-    except ValueError:
-        return jsonify({"error": "max_results must be a positive integer"}), 400
-
-    # If the query is a population query, increase the number of results
-    # fetched to improve the chances of finding a numerical estimate.  This
-    # adjustment happens after reading the user‑supplied value so that the
-    # variable exists when we refer to it.  We only raise the limit and
-    # never reduce it below the user’s request.
-    if "population" in query.lower():
-        max_results = max(max_results, 20)
+    # (Werkzeug returns None rather than raising when conversion fails.)
+    max_results = request.args.get("max_results", type=int)
+    if max_results is None and "max_results" not in request.args:
+        max_results = 5
+    if max_results is None or max_results <= 0:
+        return _json_response({"error": "max_results must be a positive integer"}, 400)
 
     # Determine the region based on the query.  By default, use English (us-en).
     region = request.args.get("region")
     if not region:
         # If the query contains non‑ASCII characters, fall back to a global region
         # to allow other languages.  Otherwise default to US English.
-        region = "wt-wt" if any(ord(ch) > 127 for ch in query) else "us-en"
+        region = _REGION_EN if ascii_query else _REGION_WORLDWIDE
 
     safesearch = request.args.get("safesearch", "moderate").lower()
     timelimit = request.args.get("timelimit")  # None means no filter
 
     # Validate safesearch parameter
-    if safesearch not in {"on", "moderate", "off"}:
-        return jsonify({"error": "safesearch must be 'on', 'moderate', or 'off'"}), 400
+    if safesearch not in _SAFESEARCH_VALUES:
+        return _json_response({"error": "safesearch must be 'on', 'moderate', or 'off'"}, 400)
 
+    # Parse and validate the optional result field projection.
+    fields = None
+    fields_param = request.args.get("fields")
+    if fields_param:
+        fields = tuple(f.strip().lower() for f in fields_param.split(",") if f.strip())
+        if not fields or not set(fields) <= _RESULT_FIELDS:
+            return _json_response(
+                {"error": "fields must be a comma-separated list of 'title', 'href' and 'body'"},
+                400,
+            )
+        if set(fields) == _RESULT_FIELDS:
+            # All fields requested; skip the projection.
+            fields = None
+
+    # Serve repeated queries from the cache.  The key uses the original query
+    # because the response echoes it; the spell‑checked query and the default
+    # region are derived from it deterministically.
+    cache_key = _cache_key(
+        "search", original_query, max_results, region, safesearch, timelimit, fields
+    )
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return _search_response(cached)
+    locked = _cache_lock(cache_key)
+    if not locked:
+        # Another request is already searching for this query; wait for it.
+        cached = _cache_wait(cache_key)
+        if cached is not None:
+            return _search_response(cached)
     try:
-        results = search_engine.text(
-            keywords=query,
-            region=region,
-            safesearch=safesearch,
-            timelimit=timelimit,
-            max_results=max_results,
+        # remote_addr is the connecting address, or the address reported by
+        # a trusted proxy (see PROXY_COUNT); never a value the client chose.
+        if _rate_limited(request.remote_addr or "unknown"):
+            return _json_response({"error": "Rate limit exceeded; try again later."}, 429)
+        # Spell‑check only on a cache miss; the cache key is derived from the
+        # original query, so cache hits never need the corrected one.
+        query = _correct_spelling(original_query) if ascii_query else original_query
+        spellchecked_used = query != original_query
+        response, status = _build_response(
+            original_query,
+            query,
+            spellchecked_used,
+            max_results,
+            region,
+            safesearch,
+            timelimit,
+            fields,
         )
+        # Cache the serialized bytes so cache hits skip encoding entirely.
+        payload = _dumps(response)
+        if status == 200:
+            _cache_set(cache_key, payload, SEARCH_CACHE_TTL)
+    finally:
+        if locked:
+            _cache_unlock(cache_key)
+    if status == 200:
+        return _search_response(payload)
+    return _json_response(payload, status)
+
+
+def _future_result(future, deadline: float) -> Optional[str]:
+    """Return the result of a lookup ``future``, waiting until ``deadline``.
+
+    :param future: Future from :data:`_executor`, or ``None``.
+    :param deadline: ``time.monotonic()`` value after which to stop waiting.
+    :return: The lookup result, or ``None`` if there is no future or it did
+        not finish in time.  A late lookup keeps running and still fills the
+        cache for the next request.
+    """
+    if future is None:
+        return None
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeout:
+        return None
+
+
+def _build_response(
+    original_query: str,
+    query: str,
+    spellchecked_used: bool,
+    max_results: int,
+    region: str,
+    safesearch: str,
+    timelimit: Optional[str],
+    fields: Optional[Tuple[str, ...]] = None,
+) -> Tuple[Dict, int]:
+    """Run the search and build the response body for :func:`search`.
+
+    When ``fields`` is given, each result is reduced to those keys once the
+    answer heuristics (which need the full results) have run.
+
+    Returns the response dictionary together with its HTTP status code.
+    """
+    # The search and background lookups must finish within REQUEST_DEADLINE
+    # of this point.  A search that is still running after that fails the
+    # request; a lookup that is still running is treated as no answer.
+    deadline = time.monotonic() + REQUEST_DEADLINE
+
+    # Most queries are neither questions nor population queries; cheap prefix
+    # and substring checks let them skip the answer heuristics entirely.
+    lower_query = query.lower().strip()
+    needs_wiki = (
+        lower_query.startswith(_QUESTION_PREFIXES) or lower_query.endswith("definition")
+    )
+    needs_pop = _POP_TRIGGER_RE.search(lower_query) is not None
+    pop_subject = _population_subject(lower_query) if needs_pop else None
+
+    # Attempt to generate a concise answer for common question patterns when
+    # Wikipedia is available.  This is best effort and will be skipped if
+    # requests is not installed or no summary is found.  The lookup does not
+    # depend on the search results, so it runs while DuckDuckGo is queried.
+    wiki_future = None
+    if _http is not None and needs_wiki:
+        topic = _question_topic(lower_query)
+        if topic:
+            wiki_future = _submit_lookup(_wikipedia_summary, topic)
+
+    # Short queries that are neither questions nor population queries almost
+    # always end up in the general Wikipedia fallback below, so start that
+    # lookup now as well instead of after the search.  When every lookup
+    # worker is busy it is not started, and runs after the search only if
+    # the search finds results but no other answer.
+    short_query = 1 <= len(lower_query.split()) <= 3
+    fallback_future = None
+    if _http is not None and short_query and wiki_future is None and pop_subject is None:
+        fallback_future = _submit_lookup(_wikipedia_summary, query, speculative=True)
+
+    # If the query is a population query, increase the number of results
+    # fetched to improve the chances of finding a numerical estimate.  We only
+    # raise the limit and never reduce it below the user’s request.
+    fetch_limit = max(max_results, 20) if "population" in lower_query else max_results
+
+    try:
+        with _borrow_search_engine() as engine:
+            results = _run_blocking(
+                _text_results,
+                engine,
+                keywords=query,
+                region=region,
+                safesearch=safesearch,
+                timelimit=timelimit,
+                max_results=fetch_limit,
+                timeout=max(0.0, deadline - time.monotonic()),
+            )
+    except FutureTimeout:
+        return {"error": "Search timed out"}, 504
     except Exception as ex:
         # Return a generic error message; in production you might log ex
-        return jsonify({"error": f"Search failed: {ex}"}), 500
+        return {"error": f"Search failed: {ex}"}, 500
 
     # Post‑process the results to remove obviously irrelevant hits.
-    results = _filter_results_by_keywords(query, results)
+    results = _filter_results_by_keywords(_query_keywords(lower_query), results)
 
     # Build the base response.  Always echo the original query the user sent.
     response = {
@@ -288,122 +1154,112 @@ def search():
 
     if not results:
         response["message"] = "No results found for the given query."
-        return jsonify(response), 200
+        return response, 200
 
-    # Attempt to generate a concise answer for common question patterns when
-    # wikipedia is available.  This is best effort and will be skipped if
-    # wikipedia is not installed or no summary is found.
-    answer = None
-    if wikipedia is not None:
-        # Normalize the query for analysis
-        lower_query = query.lower().strip()
-        # If the query asks "what is", "who is", "define", etc.,
-        # we attempt to fetch a short summary from Wikipedia.
-        patterns = [
-            r"^(what is|who is|define|meaning of)\s+(.+)",
-            r"^(.+)\s+definition$",
-        ]
-        match = None
-        for pattern in patterns:
-            m = re.match(pattern, lower_query)
-            if m:
-                # The topic is in the last captured group
-                topic = m.groups()[-1]
-                match = topic
-                break
-
-        # Handle questions starting with "how many" or "population of"
-        if not match:
-            if lower_query.startswith("how many") or lower_query.startswith("population of"):
-                # Extract the subject for population queries
-                # e.g., "how many cats exist" -> "cats"
-                subject = lower_query
-                # Remove leading phrases
-                for prefix in ["how many", "population of", "number of", "count of"]:
-                    if subject.startswith(prefix):
-                        subject = subject[len(prefix):].strip()
-                # Remove common trailing words
-                subject = re.sub(r"( exist| are there| are)", "", subject).strip()
-                match = subject + " population"
-
-        if match:
-            try:
-                # Use Wikipedia search to find the best page
-                search_results = wikipedia.search(match)
-                if search_results:
-                    page_title = search_results[0]
-                    # Fetch a concise summary (first sentence)
-                    summary = wikipedia.summary(page_title, sentences=1)
-                    answer = summary.strip()
-            except Exception:
-                # If Wikipedia search fails, ignore and proceed without answer
-                answer = None
+    # Wait for the Wikipedia lookup started alongside the search, if any.
+    answer = _future_result(wiki_future, deadline)
 
     # If we already found an answer from Wikipedia, include it.
     if answer:
         response["answer"] = answer
-    else:
+    elif pop_subject:
         # Additional heuristic: handle general population queries even when not
-        # prefixed by "how many" or "population of". Correct common misspellings.
-        # Work on a lowercased version of the query for analysis. Avoid using
-        # lower_query from the Wikipedia block which may not exist if wikipedia
-        # is None.
-        lower_query_corrected = query.lower().strip()
-        # Fix typical misspellings of "population"
-        for misspelling in ["poplutation", "popluation", "popultation", "populaton"]:
-            lower_query_corrected = lower_query_corrected.replace(misspelling, "population")
-        if "population" in lower_query_corrected:
-            # Extract the subject by removing leading population phrases.
-            # E.g., "cat population" -> "cat", "population of cats" -> "cats".
-            subject = lower_query_corrected
-            for prefix in ["population of", "population for", "population in", "population"]:
-                if subject.startswith(prefix):
-                    subject = subject[len(prefix):].strip()
-                    break
-            # Also remove a trailing " population" if present (e.g., "cat population").
-            if subject.endswith(" population"):
-                subject = subject[: -len(" population")].strip()
-            # If we have a subject, first check static estimates dictionary.
-            if subject:
-                estimate = STATIC_POPULATION_ESTIMATES.get(subject.lower())
-                if estimate:
-                    response["answer"] = f"The estimated {subject} population is {estimate}."
-                else:
-                    pop_answer = _extract_population_from_snippets(subject, results)
-                    if pop_answer:
-                        response["answer"] = pop_answer
+        # prefixed by "how many" or "population of".  First check the static
+        # estimates dictionary, then the search snippets.
+        estimate = STATIC_POPULATION_ESTIMATES.get(pop_subject)
+        if estimate:
+            response["answer"] = f"The estimated {pop_subject} population is {estimate}."
+        else:
+            pop_answer = _extract_population_from_snippets(pop_subject, results)
+            if pop_answer:
+                response["answer"] = pop_answer
 
     # As a final attempt, if we still don't have an answer and Wikipedia is
     # available, try a general summary for short queries (one to three words).
-    if wikipedia is not None and "answer" not in response:
+    if _http is not None and "answer" not in response:
         # Only attempt general summary for simple queries (e.g., "hello", "cat")
-        tokens = query.lower().split()
-        if 1 <= len(tokens) <= 3:
-            try:
-                search_results = wikipedia.search(query)
-                if search_results:
-                    page_title = search_results[0]
-                    summary = wikipedia.summary(page_title, sentences=1)
-                    if summary:
-                        response["answer"] = summary.strip()
-            except Exception:
-                pass
+        if short_query:
+            # Look it up now if it was not started alongside the search, as
+            # long as there is time left before the deadline.
+            if fallback_future is None and time.monotonic() < deadline:
+                fallback_future = _submit_lookup(_wikipedia_summary, query)
+            summary = _future_result(fallback_future, deadline)
+            if summary:
+                response["answer"] = summary
+
+    if fields is not None:
+        response["results"] = [{k: res.get(k) for k in fields} for res in results]
+
+    return response, 200
 
-    return jsonify(response)
+
+def warm_up() -> None:
+    """Open the upstream HTTPS connections before the first request.
+
+    Called by Gunicorn in each worker after forking (see gunicorn_conf.py) so
+    that the first search does not pay for the TLS handshakes.  Failures are
+    ignored; the connections will simply be opened on first use instead.
+    """
+    try:
+        with _borrow_search_engine() as engine:
+            list(engine.text("warmup", max_results=1) or ())
+    except Exception:
+        pass
+    if _http is not None:
+        try:
+            _http.head(WIKIPEDIA_API_URL, timeout=WIKI_TIMEOUT)
+        except Exception:
+            pass
 
 
 def run():
-    """Run the Flask development server.
+    """Run the API server.
+
+    When gunicorn and gevent are installed, this serves the app with
+    Gunicorn and the settings from gunicorn_conf.py: gevent workers
+    multiplex many in‑flight requests per worker, with DuckDuckGo searches
+    offloaded to OS threads (see _run_blocking).  The equivalent command
+    line is:
 
-    When deploying to a production environment you should use a WSGI server
-    like Gunicorn or Uvicorn (for ASGI).  For example:
+        gunicorn -c gunicorn_conf.py gooblox_api:app
 
-        gunicorn --bind 0.0.0.0:8000 gooblox_api:app
+    or, without the configuration file:
 
-    This function is provided for convenience when testing locally.
+        gunicorn -k gevent -w $((2*NCPU+1)) --worker-connections 1000 \\
+            --preload --bind 0.0.0.0:$PORT gooblox_api:app
+
+    where NCPU is the number of CPU cores.  To compare against plain
+    synchronous workers, drop ``-k gevent`` and ``--worker-connections``.
+
+    Set ``FLASK_DEBUG=1``, or leave gunicorn/gevent uninstalled, to use the
+    threaded Flask development server instead, e.g. when testing locally.
     """
     port = int(os.environ.get("PORT", 8000))
-    app.run(host="0.0.0.0", port=port, debug=False)
+    # The gevent worker class needs gevent as well as gunicorn.
+    if os.environ.get("FLASK_DEBUG") != "1" and gevent is not None:
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError:
+            BaseApplication = None
+        if BaseApplication is not None:
+            import gunicorn_conf
+
+            class _GunicornApp(BaseApplication):
+                def load_config(self):
+                    settings = ("bind", "workers", "worker_class", "worker_connections", "preload_app")
+                    for key in settings:
+                        self.cfg.set(key, getattr(gunicorn_conf, key))
+                    # Warm up this module's clients.  gunicorn_conf.post_fork
+                    # would import gooblox_api a second time when this file is
+                    # run as a script.
+                    self.cfg.set("post_fork", lambda server, worker: warm_up())
+
+                def load(self):
+                    return app
+
+            _GunicornApp().run()
+            return
+    app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for the GooBlox API.
+
+Usage:
+
+    gunicorn -c gunicorn_conf.py gooblox_api:app
+
+The app is loaded once in the master process and forked into gevent
+workers, so imports, compiled regular expressions and the spell‑checker
+dictionary are shared copy‑on‑write between workers.  Each worker then
+opens its own upstream connections in ``post_fork`` so the first real
+search does not pay for the TLS handshakes.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+# gevent workers multiplex requests on greenlets.  DuckDuckGo searches use
+# I/O that gevent cannot patch, so gooblox_api runs them in real OS threads.
+worker_class = "gevent"
+worker_connections = 1000
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Connections must not be opened before forking, or workers would share
+    # the same sockets.  Warm them up in each worker instead.
+    import gooblox_api
+
+    gooblox_api.warm_up()
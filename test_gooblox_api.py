@@ -0,0 +1,44 @@
+"""Tests for the arithmetic fast path of the GooBlox API."""
+
+import pytest
+
+from gooblox_api import _fast_path_answer
+
+
+@pytest.mark.parametrize(
+    "query, answer",
+    [
+        # Arithmetic is answered without searching.
+        ("2+2", "4"),
+        ("2 + 2", "4"),
+        ("12 * (3 + 4)", "84"),
+        ("2 * -3", "-6"),
+        ("-5 + 3", "-2"),
+        ("(10 - 5) / 2", "2.5"),
+        ("100 / (4 - 2)", "50"),
+        ("( 10 - 5 ) * 2", "10"),
+        # Bare numbers are searched.
+        ("1984", None),
+        ("(1984)", None),
+        # Dates and ranges are searched, with or without spaces.
+        ("12/25", None),
+        ("1/2/2024", None),
+        ("10/4", None),
+        ("10 / 4", None),
+        ("(10/4)", None),
+        ("2024-2025", None),
+        ("1939 - 1945", None),
+        ("10 - 5", None),
+        ("(2020-2021)", None),
+        # Phone numbers are searched.
+        ("+1-800-555-1234", None),
+        ("+49-30-1234567", None),
+        ("(555)-123-4567", None),
+        ("(555) 123-4567", None),
+        # Unsupported or invalid expressions are searched.
+        ("2**10", None),
+        ("1/0 + 1", None),
+    ],
+)
+def test_fast_path_answer(query, answer):
+    assert _fast_path_answer(query) == answer